@@ -22,6 +22,7 @@ Exceptions:
         ...     print(f"API error: {e}")
 """
 
+from .async_client import WdmmgAsyncClient
 from .client import (
     WdmmgAPIError,
     WdmmgAuthError,
@@ -32,6 +33,7 @@ from .client import (
 
 __all__ = [
     "WdmmgClient",
+    "WdmmgAsyncClient",
     "WdmmgError",
     "WdmmgAuthError",
     "WdmmgRateLimitError",
@@ -0,0 +1,59 @@
+"""Hot-path helpers for the WDMMG client.
+
+This module is kept free of dynamic features so it can be compiled with
+mypyc. Wheels built with ``HATCH_BUILD_HOOK_ENABLE_MYPYC=true`` ship a
+compiled extension that Python imports in place of this file; otherwise
+the pure-Python version below is used.
+"""
+
+from datetime import date
+from typing import Any
+
+
+def normalize_date(value: str | date | None) -> str | None:
+    """Normalize a date value to ISO format string.
+
+    Args:
+        value: A date object, ISO format string (YYYY-MM-DD), or None.
+
+    Returns:
+        ISO format date string, or None if input is None.
+
+    Raises:
+        ValueError: If the string is not in valid ISO format.
+        TypeError: If the value is not a string, date, or None.
+    """
+    if value is None:
+        return None
+    if isinstance(value, date):
+        return value.isoformat()
+    if isinstance(value, str):
+        # Validate the string format by parsing it
+        try:
+            date.fromisoformat(value)
+        except ValueError as e:
+            raise ValueError(
+                f"Invalid date format: '{value}'. Expected ISO format (YYYY-MM-DD)."
+            ) from e
+        return value
+    raise TypeError(
+        f"Expected str, date, or None, got {type(value).__name__}"
+    )
+
+
+def extract_page(data: dict[str, Any]) -> tuple[list[Any], bool]:
+    """Split a transactions page into its rows and has_more flag.
+
+    Args:
+        data: A page response with a "transactions" key.
+
+    Returns:
+        A (transactions, has_more) tuple.
+
+    Raises:
+        KeyError: If the page has no "transactions" key.
+    """
+    # A page without "transactions" is a server bug; let it surface
+    transactions: list[Any] = data["transactions"]
+    has_more = bool(data.get("has_more", False))
+    return transactions, has_more
@@ -0,0 +1,343 @@
+"""Asynchronous WDMMG API Client.
+
+This module provides an asyncio client for the WDMMG API, built on httpx.
+It mirrors WdmmgClient, so independent requests can run concurrently.
+
+Requires the ``async`` extra (``pip install "wdmmg[async]"``).
+
+Example:
+    >>> import asyncio
+    >>> from wdmmg import WdmmgAsyncClient
+    >>> async def main():
+    ...     async with WdmmgAsyncClient(api_key="your-api-key") as client:
+    ...         accounts, transactions = await asyncio.gather(
+    ...             client.get_accounts(),
+    ...             client.get_transactions(start_date="2024-01-01"),
+    ...         )
+    >>> asyncio.run(main())
+"""
+
+import asyncio
+import copy
+import importlib.util
+import logging
+from collections import deque
+from datetime import date
+from typing import Any, AsyncIterator, Sequence
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover - optional dependency
+    httpx = None  # type: ignore[assignment]
+
+from ._fastpath import extract_page
+from .client import (
+    WdmmgClient,
+    _check_response,
+    _decode_json,
+    _make_async_httpx_client,
+    _next_retry_delay,
+    _resolve_config,
+    _translate_httpx_errors,
+)
+
+logger = logging.getLogger(__name__)
+
+# HTTP/2 needs the optional h2 package; fall back to HTTP/1.1 without it
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+
+class WdmmgAsyncClient:
+    """Asynchronous client for the WDMMG API.
+
+    Accepts the same arguments as WdmmgClient, except use_http2, and offers
+    the same public methods as coroutines, without the typed option.
+    Requests share one connection pool and, when the h2 package is
+    installed, are multiplexed over a single HTTP/2 connection.
+
+    Args:
+        api_key: Your WDMMG API key. If not provided, reads from the
+            WDMMG_API_KEY environment variable.
+        base_url: Override the default API base URL. Can also be set via
+            WDMMG_BASE_URL environment variable.
+        timeout: Request timeout in seconds. Can be a single float or a
+            tuple of (connect_timeout, read_timeout). Defaults to (5, 30).
+        max_retries: Maximum number of retries for failed requests. Retries
+            use exponential backoff with jitter and apply to connection
+            errors and specific status codes (429, 500, 502, 503, 504).
+        pool_maxsize: Maximum number of open connections. Defaults to 20.
+
+    Raises:
+        ImportError: If httpx is not installed.
+        ValueError: If no API key is provided and WDMMG_API_KEY is not set.
+
+    Example:
+        >>> async with WdmmgAsyncClient() as client:
+        ...     async for txn in client.iter_transactions(prefetch=4):
+        ...         process(txn)
+    """
+
+    def __init__(
+            self,
+            api_key: str | None = None,
+            *,
+            base_url: str | None = None,
+            timeout: tuple[float, float] | float = WdmmgClient.DEFAULT_TIMEOUT,
+            max_retries: int = WdmmgClient.DEFAULT_MAX_RETRIES,
+            pool_maxsize: int = WdmmgClient.DEFAULT_POOL_MAXSIZE,
+    ):
+        if httpx is None:
+            raise ImportError(
+                "WdmmgAsyncClient requires httpx. Install it with: pip install 'wdmmg[async]'"
+            )
+
+        self._api_key, self._base_url = _resolve_config(
+            api_key, base_url, WdmmgClient.DEFAULT_BASE_URL
+        )
+        self._accounts_url = f"{self._base_url}/accounts"
+        self._transactions_url = f"{self._base_url}/transactions"
+        self._max_retries = max_retries
+        # Last get_accounts() result and its ETag, for conditional requests
+        self._accounts_cache: list[dict[str, Any]] | None = None
+        self._accounts_etag: str | None = None
+        self._client = _make_async_httpx_client(
+            self._api_key,
+            timeout,
+            pool_maxsize,
+            max_retries,
+            http2=_HTTP2_AVAILABLE,
+        )
+
+        logger.debug(
+            "Initialized WdmmgAsyncClient with base_url=%s, timeout=%s, max_retries=%d, http2=%s",
+            self._base_url,
+            timeout,
+            max_retries,
+            _HTTP2_AVAILABLE,
+        )
+
+    async def aclose(self) -> None:
+        """Close the underlying HTTP client and release resources."""
+        await self._client.aclose()
+        logger.debug("Closed WdmmgAsyncClient")
+
+    async def __aenter__(self) -> "WdmmgAsyncClient":
+        """Enter the async context manager."""
+        return self
+
+    async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        """Exit the async context manager and close the client."""
+        await self.aclose()
+
+    async def get_accounts(self, refresh: bool = False) -> list[dict[str, Any]]:
+        """Fetch all accounts associated with the API key.
+
+        See WdmmgClient.get_accounts().
+        """
+        logger.info("Fetching accounts")
+        headers = {}
+        if not refresh and self._accounts_etag is not None:
+            headers["If-None-Match"] = self._accounts_etag
+
+        response = await self._send("GET", self._accounts_url, headers=headers)
+        if response.status_code == 304 and self._accounts_cache is not None:
+            logger.info("Accounts not modified; using %d cached accounts", len(self._accounts_cache))
+            return copy.deepcopy(self._accounts_cache)
+
+        data = _decode_json(response)
+        accounts = data if isinstance(data, list) else data.get("accounts", [])
+        self._accounts_etag = response.headers.get("ETag")
+        self._accounts_cache = accounts
+        logger.info("Fetched %d accounts", len(accounts))
+        return copy.deepcopy(accounts)
+
+    async def get_transactions(
+            self,
+            start_date: str | date | None = None,
+            end_date: str | date | None = None,
+    ) -> list[dict[str, Any]]:
+        """Fetch all transactions, handling pagination automatically.
+
+        See WdmmgClient.get_transactions().
+        """
+        return [txn async for txn in self.iter_transactions(start_date, end_date)]
+
+    async def get_transactions_multi(
+            self,
+            ranges: Sequence[tuple[str | date | None, str | date | None]],
+            page_size: int = WdmmgClient.DEFAULT_PAGE_SIZE,
+    ) -> list[list[dict[str, Any]]]:
+        """Fetch transactions for several date ranges at once.
+
+        See WdmmgClient.get_transactions_multi(). The ranges are always
+        fetched concurrently as tasks; the batch endpoint is not used.
+        """
+        if not ranges:
+            return []
+
+        logger.info("Fetching transactions for %d date ranges", len(ranges))
+        # Validate every range before sending anything
+        params_list = [
+            WdmmgClient._transaction_params(start_date, end_date, page_size)
+            for start_date, end_date in ranges
+        ]
+
+        tasks = [
+            asyncio.ensure_future(self._fetch_range(params, page_size))
+            for params in params_list
+        ]
+        try:
+            results = await asyncio.gather(*tasks)
+        finally:
+            # Stop the other ranges if one of them failed
+            for task in tasks:
+                task.cancel()
+
+        logger.info("Fetched %d total transactions", sum(len(rows) for rows in results))
+        return list(results)
+
+    async def _fetch_range(self, params: dict[str, Any], page_size: int) -> list[dict[str, Any]]:
+        """Fetch every transaction page for one query.
+
+        Args:
+            params: Query parameters from WdmmgClient._transaction_params().
+            page_size: Number of transactions per page.
+
+        Returns:
+            All transactions matching the query.
+        """
+        offset = 0
+        rows: list[dict[str, Any]] = []
+        while True:
+            data = await self._request_url(
+                "GET", self._transactions_url, params={**params, "offset": offset}
+            )
+            transactions, has_more = extract_page(data)
+            rows.extend(transactions)
+            if not has_more:
+                return rows
+            offset += page_size
+
+    async def iter_transactions(
+            self,
+            start_date: str | date | None = None,
+            end_date: str | date | None = None,
+            page_size: int = WdmmgClient.DEFAULT_PAGE_SIZE,
+            prefetch: int = 0,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Iterate over transactions, yielding one at a time.
+
+        See WdmmgClient.iter_transactions(). With prefetch > 0, up to
+        `prefetch` page requests run concurrently as tasks while the current
+        page is consumed.
+        """
+        if prefetch < 0:
+            raise ValueError(f"prefetch must be >= 0, got {prefetch}")
+
+        logger.info(
+            "Fetching transactions (start_date=%s, end_date=%s)",
+            start_date,
+            end_date,
+        )
+
+        params = WdmmgClient._transaction_params(start_date, end_date, page_size)
+        pending: deque[asyncio.Task[Any]] = deque()
+        next_offset = 0
+        offset = 0
+        total_fetched = 0
+        debug = logger.isEnabledFor(logging.DEBUG)
+
+        def submit_next() -> None:
+            nonlocal next_offset
+            page_params = {**params, "offset": next_offset}
+            pending.append(asyncio.ensure_future(
+                self._request_url("GET", self._transactions_url, params=page_params)
+            ))
+            next_offset += page_size
+
+        try:
+            for _ in range(max(prefetch, 1)):
+                submit_next()
+
+            while pending:
+                data = await pending.popleft()
+                has_more = data.get("has_more", False)
+                if has_more and prefetch:
+                    # Keep the window full while the caller consumes this page
+                    submit_next()
+
+                transactions = data["transactions"]
+                for txn in transactions:
+                    yield txn
+                total_fetched += len(transactions)
+
+                if debug:
+                    logger.debug(
+                        "Fetched page: offset=%d, count=%d, has_more=%s",
+                        offset,
+                        len(transactions),
+                        has_more,
+                    )
+                offset += page_size
+                if not has_more:
+                    break
+                if not prefetch:
+                    submit_next()
+        finally:
+            # Discard speculative requests past the end of the result set,
+            # including any errors they raised
+            for task in pending:
+                if not task.done():
+                    task.cancel()
+                elif not task.cancelled():
+                    task.exception()
+
+        logger.info("Fetched %d total transactions", total_fetched)
+
+    async def _request_url(self, method: str, url: str, **kwargs: Any) -> Any:
+        """Make an HTTP request to an absolute API URL.
+
+        Args:
+            method: HTTP method (GET, POST, PUT, DELETE, etc.)
+            url: Absolute request URL
+            **kwargs: Additional arguments passed to httpx.AsyncClient.request()
+
+        Returns:
+            Parsed JSON response.
+
+        Raises:
+            See _send().
+        """
+        return _decode_json(await self._send(method, url, **kwargs))
+
+    async def _send(self, method: str, url: str, **kwargs: Any) -> "httpx.Response":
+        """Send an HTTP request, retrying on failure, and check the status.
+
+        Args:
+            method: HTTP method (GET, POST, PUT, DELETE, etc.)
+            url: Absolute request URL
+            **kwargs: Additional arguments passed to httpx.AsyncClient.request()
+
+        Returns:
+            The successful response.
+
+        Raises:
+            WdmmgAuthError: If authentication fails (401/403)
+            WdmmgRateLimitError: If rate limit is exceeded (429) after
+                retries are exhausted
+            WdmmgAPIError: If the API returns any other error (4xx/5xx)
+            WdmmgError: If the request fails due to network issues
+        """
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Request: %s %s params=%s", method, url, kwargs.get("params"))
+
+        for attempt in range(self._max_retries + 1):
+            with _translate_httpx_errors(method, url):
+                response = await self._client.request(method, url, **kwargs)
+            delay = _next_retry_delay(method, url, response, attempt, self._max_retries)
+            if delay is None:
+                break
+            await asyncio.sleep(delay)
+
+        _check_response(response)
+        return response
@@ -9,17 +9,67 @@ Example:
     ...     transactions = client.get_transactions(start_date="2024-01-01")
 """
 
+import copy
+import functools
+import json
 import logging
+import math
 import os
+import random
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import date
-from typing import Any, Iterator
+from decimal import Decimal
+from contextlib import contextmanager
+from itertools import repeat, takewhile
+from typing import IO, Any, Callable, Generator, Iterator, Sequence
 
 import requests
+import urllib3
 from requests.adapters import HTTPAdapter
+from urllib3.exceptions import InvalidHeader, ReadTimeoutError
 from urllib3.util.retry import Retry
 
+from ._fastpath import extract_page, normalize_date
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None  # type: ignore[assignment]
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover - optional dependency
+    httpx = None  # type: ignore[assignment]
+
+try:
+    import msgspec
+except ImportError:  # pragma: no cover - optional dependency
+    msgspec = None  # type: ignore[assignment]
+
+try:
+    import ijson  # type: ignore[import-untyped]
+    from ijson.common import ObjectBuilder  # type: ignore[import-untyped]
+except ImportError:  # pragma: no cover - optional speedup
+    ijson = None
+
 logger = logging.getLogger(__name__)
 
+# Status codes retried with backoff before an error is raised
+_RETRY_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+_BACKOFF_FACTOR = 0.5
+
+# Batch endpoint statuses meaning "not supported" when probing
+_BATCH_UNSUPPORTED_STATUSES = frozenset({404, 405, 501})
+
+# Error bodies longer than this are truncated in WdmmgAPIError
+_ERROR_BODY_LIMIT = 8192
+
+# Repeated queries over the same range skip re-parsing their dates.
+# Only cache checked (hashable) values; see WdmmgClient._normalize_date()
+_normalize_date_cached = functools.lru_cache(maxsize=256)(normalize_date)
+
 
 # =============================================================================
 # Exceptions
@@ -42,6 +92,10 @@ class WdmmgAuthError(WdmmgError):
 class WdmmgRateLimitError(WdmmgError):
     """Raised when the API rate limit is exceeded (HTTP 429).
 
+    Rate-limited requests are retried automatically, honoring the
+    ``Retry-After`` header; this is only raised once the retry budget
+    is exhausted.
+
     Attributes:
         retry_after: Number of seconds to wait before retrying, if provided
             by the API. May be None if the header was not present.
@@ -62,7 +116,8 @@ class WdmmgAPIError(WdmmgError):
 
     Attributes:
         status_code: The HTTP status code returned by the API.
-        response_body: The raw response body from the API.
+        response_body: The response body from the API, truncated to its
+            first 8 KiB.
     """
 
     def __init__(self, status_code: int, response_body: str):
@@ -71,6 +126,43 @@ class WdmmgAPIError(WdmmgError):
         super().__init__(f"API error {status_code}: {response_body}")
 
 
+# =============================================================================
+# Retry policy
+# =============================================================================
+
+
+class _JitteredRetry(Retry):
+    """Retry policy using exponential backoff with random jitter.
+
+    Jitter keeps clients that were rate limited at the same moment from
+    retrying in lockstep. Implemented as an override rather than through
+    urllib3's ``backoff_jitter``/``backoff_max`` arguments, which only exist
+    in urllib3 2.x. The settings are class attributes so they survive
+    ``Retry.new()``, which rebuilds the policy after every attempt.
+
+    This policy is the single owner of 429 handling: ``Retry-After`` delays
+    are honored (capped at ``BACKOFF_MAX``) and the client only raises
+    WdmmgRateLimitError once retries run out.
+    """
+
+    BACKOFF_JITTER = 0.5
+    BACKOFF_MAX = 30.0
+
+    def get_backoff_time(self) -> float:
+        # Count consecutive errors the way urllib3 does, then share the
+        # schedule with the httpx transports via _backoff_delay()
+        consecutive_errors = len(list(
+            takewhile(lambda entry: entry.redirect_location is None, reversed(self.history))
+        ))
+        return _backoff_delay(consecutive_errors, self.backoff_factor)
+
+    def get_retry_after(self, response: Any) -> float | None:
+        retry_after = super().get_retry_after(response)
+        if retry_after is None:
+            return None
+        return min(retry_after, self.BACKOFF_MAX) + random.uniform(0, 1)
+
+
 # =============================================================================
 # Client
 # =============================================================================
@@ -89,11 +181,20 @@ class WdmmgClient:
             both connect and read) or a tuple of (connect_timeout, read_timeout).
             Defaults to (5, 30) meaning 5s to connect, 30s to read.
         max_retries: Maximum number of retries for failed requests. Retries
-            use exponential backoff and only apply to idempotent methods
+            use exponential backoff with jitter and only apply to idempotent methods
             and specific status codes (429, 500, 502, 503, 504).
+        pool_maxsize: Maximum number of connections kept alive in the
+            connection pool. All requests target a single host, so this
+            bounds how many threads can share the client without
+            reconnecting. Defaults to 20.
+        use_http2: Send requests over HTTP/2 using httpx instead of
+            requests, so concurrent requests (e.g. with prefetch) share a
+            single multiplexed connection. Requires the ``async`` extra.
+            Defaults to False.
 
     Raises:
         ValueError: If no API key is provided and WDMMG_API_KEY is not set.
+        ImportError: If use_http2 is True and httpx or h2 is not installed.
 
     Example:
         Using as a context manager (recommended)::
@@ -120,6 +221,10 @@ class WdmmgClient:
     DEFAULT_BASE_URL = "https://wdmmg.io/api/v1"
     DEFAULT_TIMEOUT: tuple[float, float] = (5.0, 30.0)
     DEFAULT_MAX_RETRIES = 3
+    DEFAULT_POOL_MAXSIZE = 20
+    DEFAULT_PAGE_SIZE = 500
+    MIN_PAGE_SIZE = 1
+    MAX_PAGE_SIZE = 1000
 
     def __init__(
             self,
@@ -128,22 +233,20 @@ class WdmmgClient:
             base_url: str | None = None,
             timeout: tuple[float, float] | float = DEFAULT_TIMEOUT,
             max_retries: int = DEFAULT_MAX_RETRIES,
+            pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+            use_http2: bool = False,
     ):
-        # Resolve API key from argument or environment
-        self._api_key = api_key or os.environ.get("WDMMG_API_KEY")
-        if not self._api_key:
-            raise ValueError(
-                "API key is required. Pass api_key argument or set WDMMG_API_KEY environment variable."
-            )
-
-        # Resolve base URL from argument or environment
-        resolved_base_url = (
-                base_url
-                or os.environ.get("WDMMG_BASE_URL")
-                or self.DEFAULT_BASE_URL
-        )
-        self._base_url = resolved_base_url.rstrip("/")
+        self._api_key, self._base_url = _resolve_config(api_key, base_url, self.DEFAULT_BASE_URL)
+        self._accounts_url = f"{self._base_url}/accounts"
+        self._batch_url = f"{self._base_url}/batch"
+        self._transactions_url = f"{self._base_url}/transactions"
         self._timeout = timeout
+        self._pool_maxsize = pool_maxsize
+        # Unknown until the first get_transactions_multi() call probes /batch
+        self._batch_supported: bool | None = None
+        # Last get_accounts() result and its ETag, for conditional requests
+        self._accounts_cache: list[dict[str, Any]] | None = None
+        self._accounts_etag: str | None = None
 
         # Set up session with connection pooling
         self._session = requests.Session()
@@ -152,23 +255,42 @@ class WdmmgClient:
             "Accept": "application/json",
         })
 
-        # Configure retry strategy with exponential backoff
-        retry_strategy = Retry(
+        # Configure retry strategy with jittered exponential backoff
+        retry_strategy = _JitteredRetry(
             total=max_retries,
-            backoff_factor=0.5,  # 0.5, 1.0, 2.0 seconds between retries
-            status_forcelist=[429, 500, 502, 503, 504],
+            backoff_factor=_BACKOFF_FACTOR,  # 0, 1, 2 seconds between retries, plus jitter
+            status_forcelist=sorted(_RETRY_STATUS_CODES),
             allowed_methods=["GET", "POST", "PUT", "DELETE", "PATCH"],
+            respect_retry_after_header=True,
             raise_on_status=False,  # We handle status codes ourselves
         )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
+        # Every request targets the same host, so size the per-host pool for
+        # concurrent use. pool_block=False lets bursts open transient
+        # connections instead of waiting for a free one.
+        adapter = HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=pool_maxsize,
+            pool_block=False,
+            max_retries=retry_strategy,
+        )
         self._session.mount("https://", adapter)
         self._session.mount("http://", adapter)
 
+        # Optional HTTP/2 transport; when set, it carries every request
+        self._max_retries = max_retries
+        self._http2_client: "httpx.Client | None" = (
+            _make_httpx_client(self._api_key, timeout, pool_maxsize, max_retries, http2=True)
+            if use_http2
+            else None
+        )
+
         logger.debug(
-            "Initialized WdmmgClient with base_url=%s, timeout=%s, max_retries=%d",
+            "Initialized WdmmgClient with base_url=%s, timeout=%s, max_retries=%d, pool_maxsize=%d, http2=%s",
             self._base_url,
             self._timeout,
             max_retries,
+            pool_maxsize,
+            use_http2,
         )
 
     def close(self) -> None:
@@ -179,6 +301,8 @@ class WdmmgClient:
         a context manager handles this automatically.
         """
         self._session.close()
+        if self._http2_client is not None:
+            self._http2_client.close()
         logger.debug("Closed WdmmgClient session")
 
     def __enter__(self) -> "WdmmgClient":
@@ -189,9 +313,18 @@ class WdmmgClient:
         """Exit the context manager and close the session."""
         self.close()
 
-    def get_accounts(self) -> list[dict[str, Any]]:
+    def get_accounts(self, refresh: bool = False) -> list[dict[str, Any]]:
         """Fetch all accounts associated with the API key.
 
+        Responses are cached by ETag: repeat calls send If-None-Match and
+        reuse the cached accounts when the API answers 304 Not Modified.
+        Each call returns its own copy, so callers may modify the result
+        without affecting the cache.
+
+        Args:
+            refresh: Skip the conditional request and always fetch the
+                full account list. Defaults to False.
+
         Returns:
             A list of account dictionaries
         Raises:
@@ -205,16 +338,28 @@ class WdmmgClient:
             ...     print(f"{account['name']}: {account['id']}")
         """
         logger.info("Fetching accounts")
-        data = self._request("GET", "accounts")
+        headers = {}
+        if not refresh and self._accounts_etag is not None:
+            headers["If-None-Match"] = self._accounts_etag
+
+        response = self._send("GET", self._accounts_url, headers=headers)
+        if response.status_code == 304 and self._accounts_cache is not None:
+            logger.info("Accounts not modified; using %d cached accounts", len(self._accounts_cache))
+            return copy.deepcopy(self._accounts_cache)
+
+        data = _decode_json(response)
         accounts = data if isinstance(data, list) else data.get("accounts", [])
+        self._accounts_etag = response.headers.get("ETag")
+        self._accounts_cache = accounts
         logger.info("Fetched %d accounts", len(accounts))
-        return accounts
+        return copy.deepcopy(accounts)
 
     def get_transactions(
             self,
             start_date: str | date | None = None,
             end_date: str | date | None = None,
-    ) -> list[dict[str, Any]]:
+            typed: bool = False,
+    ) -> list[Any]:
         """Fetch all transactions, handling pagination automatically.
 
         This method loads all matching transactions into memory. For large
@@ -227,9 +372,12 @@ class WdmmgClient:
             end_date: End of date range (inclusive). Accepts an ISO format
                 string (YYYY-MM-DD) or a datetime.date object. If None, no
                 upper bound is applied.
+            typed: Return validated wdmmg.models.Transaction objects instead
+                of dictionaries. Requires the ``typed`` extra.
 
         Returns:
-            A list of transaction dictionaries.
+            A list of transaction dictionaries, or Transaction objects if
+            typed is True.
 
         Raises:
             WdmmgAuthError: If the API key is invalid or expired.
@@ -245,18 +393,23 @@ class WdmmgClient:
             ... )
             >>> print(f"Found {len(transactions)} transactions")
         """
-        return list(self.iter_transactions(start_date, end_date))
+        return list(self.iter_transactions(start_date, end_date, typed=typed))
 
     def iter_transactions(
             self,
             start_date: str | date | None = None,
             end_date: str | date | None = None,
-            page_size: int = 100,
-    ) -> Iterator[dict[str, Any]]:
+            page_size: int = DEFAULT_PAGE_SIZE,
+            prefetch: int = 0,
+            typed: bool = False,
+    ) -> Iterator[Any]:
         """Iterate over transactions, yielding one at a time.
 
         This is more memory-efficient than get_transactions() for large
-        result sets, as it only keeps one page in memory at a time.
+        result sets, as it only keeps one page in memory at a time. When
+        ijson is installed, prefetch is 0, typed is False and HTTP/2 is
+        off, pages are parsed as they arrive, so only one transaction is
+        held in memory at a time.
 
         Args:
             start_date: Start of date range (inclusive). Accepts an ISO format
@@ -265,68 +418,483 @@ class WdmmgClient:
             end_date: End of date range (inclusive). Accepts an ISO format
                 string (YYYY-MM-DD) or a datetime.date object. If None, no
                 upper bound is applied.
-            page_size: Number of transactions to fetch per API call.
-                Defaults to 100. Larger values mean fewer API calls but
+            page_size: Number of transactions to fetch per API call, between
+                MIN_PAGE_SIZE and MAX_PAGE_SIZE (the server's limit).
+                Defaults to 500. Larger values mean fewer API calls but
                 more memory usage per page.
+            prefetch: Number of pages to fetch ahead in background threads
+                while the current page is being consumed. Defaults to 0
+                (fetch pages one after another). Pages requested past the
+                end of the result set are discarded. Capped at the
+                client's pool_maxsize, so every request gets a pooled
+                connection.
+            typed: Yield validated wdmmg.models.Transaction objects instead
+                of dictionaries. Each page is decoded and validated in one
+                pass with msgspec. Requires the ``typed`` extra.
 
         Yields:
-            Transaction dictionaries one at a time.
+            Transaction dictionaries (or Transaction objects if typed is
+            True) one at a time.
 
         Raises:
             WdmmgAuthError: If the API key is invalid or expired.
             WdmmgAPIError: If the API returns an error.
-            WdmmgError: If the request fails due to network issues.
-            ValueError: If date format is invalid.
+            WdmmgError: If the request fails due to network issues, a page
+                is not valid JSON, or a typed page does not match the
+                expected schema.
+            ValueError: If date format is invalid, page_size is out of range
+                or prefetch is negative.
+            TypeError: If page_size is not an integer.
+            ImportError: If typed is True and msgspec is not installed.
 
         Example:
             >>> for txn in client.iter_transactions(start_date="2024-01-01"):
             ...     if txn["amount"] > 1000:
             ...         print(f"Large transaction: {txn['description']}")
         """
+        if prefetch < 0:
+            raise ValueError(f"prefetch must be >= 0, got {prefetch}")
+
         logger.info(
             "Fetching transactions (start_date=%s, end_date=%s)",
             start_date,
             end_date,
         )
 
-        # Validate and normalize dates upfront
-        normalized_start = self._normalize_date(start_date)
-        normalized_end = self._normalize_date(end_date)
+        # Build the query once; only the offset changes between pages
+        params = self._transaction_params(start_date, end_date, page_size)
+        model = _transaction_page_model() if typed else None
+
+        if ijson is not None and not prefetch and model is None and self._http2_client is None:
+            total_fetched = yield from self._iter_transactions_stream(params, page_size)
+            logger.info("Fetched %d total transactions", total_fetched)
+            return
+
+        if prefetch:
+            pages = self._iter_pages_prefetch(params, page_size, prefetch, model)
+        else:
+            pages = self._iter_pages(params, page_size, model=model)
 
         offset = 0
-        has_more = True
         total_fetched = 0
+        # Bind hot lookups once for the page loop; checking the log level
+        # up front skips building debug arguments when debug is off
+        log_debug = logger.debug
+        debug = logger.isEnabledFor(logging.DEBUG)
+
+        for data in pages:
+            transactions, has_more = extract_page(data)
+            yield from transactions
+            total_fetched += len(transactions)
+
+            if debug:
+                log_debug(
+                    "Fetched page: offset=%d, count=%d, has_more=%s",
+                    offset,
+                    len(transactions),
+                    has_more,
+                )
+            offset += page_size
 
-        while has_more:
-            params: dict[str, Any] = {"offset": offset, "limit": page_size}
-            if normalized_start is not None:
-                params["start_date"] = normalized_start
-            if normalized_end is not None:
-                params["end_date"] = normalized_end
+        logger.info("Fetched %d total transactions", total_fetched)
+
+    def get_transactions_multi(
+            self,
+            ranges: Sequence[tuple[str | date | None, str | date | None]],
+            page_size: int = DEFAULT_PAGE_SIZE,
+    ) -> list[list[dict[str, Any]]]:
+        """Fetch transactions for several date ranges at once.
+
+        The first page of every range is requested in a single call to the
+        API's batch endpoint; any remaining pages are then fetched
+        concurrently. If the API does not offer a batch endpoint, each range
+        is fetched concurrently in full instead.
+
+        Args:
+            ranges: Sequence of (start_date, end_date) pairs. Each bound
+                follows the same rules as in get_transactions().
+            page_size: Number of transactions to fetch per API call, between
+                MIN_PAGE_SIZE and MAX_PAGE_SIZE. Defaults to 500.
+
+        Returns:
+            One list of transaction dictionaries per range, in the same
+            order as `ranges`.
+
+        Raises:
+            WdmmgAuthError: If the API key is invalid or expired.
+            WdmmgAPIError: If the API returns an error.
+            WdmmgError: If the request fails due to network issues or the
+                batch reply is invalid.
+            ValueError: If date format is invalid or page_size is out of
+                range.
+            TypeError: If page_size is not an integer.
 
-            data = self._request("GET", "transactions", params=params)
+        Example:
+            >>> q1, q2 = client.get_transactions_multi([
+            ...     ("2024-01-01", "2024-03-31"),
+            ...     ("2024-04-01", "2024-06-30"),
+            ... ])
+        """
+        if not ranges:
+            return []
+
+        logger.info("Fetching transactions for %d date ranges", len(ranges))
+        params_list = [
+            self._transaction_params(start_date, end_date, page_size)
+            for start_date, end_date in ranges
+        ]
+
+        first_pages: list[dict[str, Any] | None] = [None] * len(params_list)
+        if self._batch_supported is not False:
+            # Only the first call probes; once /batch has worked, any error
+            # from it is raised like any other API error
+            batch_pages = self._request_batch(
+                "transactions", params_list, probe=self._batch_supported is None
+            )
+            if batch_pages is None:
+                logger.info("Batch endpoint unavailable; fetching ranges concurrently")
+                self._batch_supported = False
+            else:
+                first_pages = batch_pages
+                self._batch_supported = True
+
+        max_workers = min(len(params_list), self._pool_maxsize)
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="wdmmg-multi") as executor:
+            results = list(executor.map(self._fetch_range, params_list, repeat(page_size), first_pages))
+
+        logger.info("Fetched %d total transactions", sum(len(rows) for rows in results))
+        return results
+
+    def _fetch_range(
+            self,
+            params: dict[str, Any],
+            page_size: int,
+            first_page: dict[str, Any] | None = None,
+    ) -> list[dict[str, Any]]:
+        """Fetch every transaction page for one query.
+
+        Args:
+            params: Query parameters from _transaction_params().
+            page_size: Number of transactions per page.
+            first_page: The page at offset 0, if it was already fetched.
 
-            transactions = data.get("transactions", [])
-            for txn in transactions:
-                yield txn
-                total_fetched += 1
+        Returns:
+            All transactions matching the query.
+        """
+        offset = 0
+        rows: list[dict[str, Any]] = []
+        if first_page is not None:
+            transactions, has_more = extract_page(first_page)
+            rows.extend(transactions)
+            if not has_more:
+                return rows
+            offset = page_size
+
+        for data in self._iter_pages(params, page_size, offset):
+            rows.extend(extract_page(data)[0])
+        return rows
+
+    def _request_batch(
+            self,
+            endpoint: str,
+            queries: list[dict[str, Any]],
+            probe: bool = False,
+    ) -> list[dict[str, Any] | None] | None:
+        """Issue several GET requests to one endpoint in a single batch call.
+
+        Failed sub-requests are checked like standalone responses, so they
+        raise the same exceptions. Sub-requests that failed with a retryable
+        status (429/5xx) come back as None for the caller to re-fetch
+        through the regular, retrying request path.
+
+        Args:
+            endpoint: API endpoint path shared by all sub-requests.
+            queries: Query parameters for each sub-request.
+            probe: Treat 404/405/501 from the batch endpoint as "not
+                supported" instead of an error.
+
+        Returns:
+            Parsed response bodies (or None for retryable failures), in the
+            same order as `queries`. None if probing found no batch endpoint.
 
+        Raises:
+            WdmmgAuthError: If the batch call or a sub-request is rejected
+                (401/403).
+            WdmmgAPIError: If the batch call or a sub-request fails.
+            WdmmgError: If the batch reply does not have one JSON object
+                per query.
+        """
+        payload = {
+            "requests": [
+                {"method": "GET", "path": endpoint, "query": query}
+                for query in queries
+            ]
+        }
+        accepted = _BATCH_UNSUPPORTED_STATUSES if probe else frozenset()
+        response = self._send("POST", self._batch_url, json=payload, accepted_statuses=accepted)
+        if response.status_code in accepted:
+            response.close()
+            return None
+
+        data = _decode_json(response)
+        subs = data.get("responses") if isinstance(data, dict) else None
+        if not isinstance(subs, list) or len(subs) != len(queries):
+            # A short reply would silently drop ranges from the result
+            logger.error("Invalid response: batch reply does not match %d requests", len(queries))
+            raise WdmmgError(f"Invalid response: expected {len(queries)} batch responses")
+
+        bodies: list[dict[str, Any] | None] = []
+        for sub in subs:
+            if not isinstance(sub, dict):
+                logger.error("Invalid response: batch entry is not an object")
+                raise WdmmgError("Invalid response: batch entry is not an object")
+            sub_response = _BatchSubResponse(sub)
+            if sub_response.status_code in _RETRY_STATUS_CODES:
+                bodies.append(None)
+                continue
+            _check_response(sub_response)
+            body = sub.get("body")
+            if not isinstance(body, dict):
+                logger.error("Invalid response: batch body is not an object")
+                raise WdmmgError("Invalid response: batch body is not an object")
+            bodies.append(body)
+        return bodies
+
+    @staticmethod
+    def _transaction_params(
+            start_date: str | date | None,
+            end_date: str | date | None,
+            page_size: int,
+    ) -> dict[str, Any]:
+        """Build the query parameters for a transactions request.
+
+        Args:
+            start_date: Start of date range (inclusive), or None.
+            end_date: End of date range (inclusive), or None.
+            page_size: Number of transactions per page.
+
+        Returns:
+            Query parameters starting at offset 0.
+
+        Raises:
+            ValueError: If date format is invalid or page_size is out of
+                range.
+            TypeError: If page_size is not an integer.
+        """
+        # bool is an int subclass, but True would silently mean a page of 1
+        if isinstance(page_size, bool) or not isinstance(page_size, int):
+            raise TypeError(f"page_size must be an int, got {type(page_size).__name__}")
+        if not WdmmgClient.MIN_PAGE_SIZE <= page_size <= WdmmgClient.MAX_PAGE_SIZE:
+            raise ValueError(
+                f"page_size must be between {WdmmgClient.MIN_PAGE_SIZE} and "
+                f"{WdmmgClient.MAX_PAGE_SIZE}, got {page_size}"
+            )
+
+        normalized_start = WdmmgClient._normalize_date(start_date)
+        normalized_end = WdmmgClient._normalize_date(end_date)
+
+        params: dict[str, Any] = {"offset": 0, "limit": page_size}
+        if normalized_start is not None:
+            params["start_date"] = normalized_start
+        if normalized_end is not None:
+            params["end_date"] = normalized_end
+        return params
+
+    def _page_request(self, params: dict[str, Any]) -> "_PageRequest | None":
+        """Prepare a reusable transactions request for pagination.
+
+        Args:
+            params: Query parameters shared by every page.
+
+        Returns:
+            A _PageRequest, or None when requests are sent over HTTP/2.
+        """
+        if self._http2_client is not None:
+            return None
+        return _PageRequest(self._session, self._transactions_url, params, self._timeout)
+
+    def _fetch_page(
+            self,
+            params: dict[str, Any],
+            model: type | None = None,
+            page_request: "_PageRequest | None" = None,
+    ) -> dict[str, Any]:
+        """Fetch a single page of transactions.
+
+        Args:
+            params: Query parameters, including the page offset.
+            model: Optional msgspec type to decode the page into.
+            page_request: Prepared request to clone instead of building a
+                new one from scratch.
+
+        Returns:
+            The page as a dictionary with "transactions" and "has_more" keys.
+            With a model, the transactions are model instances.
+        """
+        if page_request is not None:
+            response = self._send_prepared(page_request.prepare(params), **page_request.send_kwargs)
+        else:
+            response = self._send("GET", self._transactions_url, params=params)
+
+        if model is None:
+            return _decode_json(response)
+        page = _decode_json(response, model)
+        return {"transactions": page.transactions, "has_more": page.has_more}
+
+    def _iter_pages(
+            self,
+            params: dict[str, Any],
+            page_size: int,
+            offset: int = 0,
+            model: type | None = None,
+    ) -> Iterator[dict[str, Any]]:
+        """Fetch transaction pages one after another.
+
+        Args:
+            params: Query parameters; the "offset" key is updated in place.
+            page_size: Number of transactions per page.
+            offset: Offset of the first page to fetch.
+            model: Optional msgspec type to decode each page into.
+
+        Yields:
+            Page responses, in offset order.
+        """
+        has_more = True
+        fetch_page = self._fetch_page
+        page_request = self._page_request(params)
+
+        while has_more:
+            params["offset"] = offset
+            data = fetch_page(params, model, page_request)
+            yield data
             has_more = data.get("has_more", False)
             offset += page_size
 
-            logger.debug(
-                "Fetched page: offset=%d, count=%d, has_more=%s",
-                offset - page_size,
-                len(transactions),
-                has_more,
-            )
+    def _iter_transactions_stream(
+            self,
+            params: dict[str, Any],
+            page_size: int,
+    ) -> Generator[dict[str, Any], None, int]:
+        """Fetch transaction pages one after another, parsing them incrementally.
 
-        logger.info("Fetched %d total transactions", total_fetched)
+        Each response body is read off the socket and parsed with ijson, so
+        transactions are yielded before the rest of the page has arrived.
+
+        Args:
+            params: Query parameters; the "offset" key is updated in place.
+            page_size: Number of transactions per page.
+
+        Yields:
+            Transaction dictionaries one at a time.
+
+        Returns:
+            The total number of transactions yielded.
+
+        Raises:
+            WdmmgError: If reading the body fails or it is not valid JSON.
+            See _send() for the remaining exceptions.
+        """
+        offset = 0
+        has_more = True
+        total_fetched = 0
+        # Bind hot lookups once for the page loop
+        send_prepared = self._send_prepared
+        page_request = _PageRequest(self._session, self._transactions_url, params, self._timeout)
+        send_kwargs = {**page_request.send_kwargs, "stream": True}
+        log_debug = logger.debug
+        debug = logger.isEnabledFor(logging.DEBUG)
+
+        while has_more:
+            params["offset"] = offset
+            response = send_prepared(page_request.prepare(params), **send_kwargs)
+            try:
+                # Let urllib3 undo any Content-Encoding while ijson reads
+                response.raw.decode_content = True
+                count, has_more = yield from _iter_streamed_page(response.raw)
+            except ReadTimeoutError as e:
+                logger.error("Request timed out: GET %s", response.url)
+                raise WdmmgError(f"Request timed out: {e}") from e
+            except urllib3.exceptions.HTTPError as e:
+                logger.error("Connection error: GET %s - %s", response.url, e)
+                raise WdmmgError(f"Connection failed: {e}") from e
+            except ijson.JSONError as e:
+                logger.error("Invalid response: GET %s - %s", response.url, e)
+                raise WdmmgError(f"Invalid response: {e}") from e
+            finally:
+                response.close()
+
+            if debug:
+                log_debug(
+                    "Fetched page: offset=%d, count=%d, has_more=%s",
+                    offset,
+                    count,
+                    has_more,
+                )
+            total_fetched += count
+            offset += page_size
+
+        return total_fetched
+
+    def _iter_pages_prefetch(
+            self,
+            params: dict[str, Any],
+            page_size: int,
+            prefetch: int,
+            model: type | None = None,
+    ) -> Iterator[dict[str, Any]]:
+        """Fetch transaction pages with up to `prefetch` requests in flight.
+
+        Pages are requested speculatively at increasing offsets and yielded
+        in order. Once a page reports has_more=False, outstanding requests
+        are cancelled and their results (or errors) discarded.
+
+        Args:
+            params: Base query parameters; each request gets its own copy.
+            page_size: Number of transactions per page.
+            prefetch: Maximum number of concurrent page requests, capped at
+                the connection pool size.
+            model: Optional msgspec type to decode each page into.
+
+        Yields:
+            Page responses, in offset order.
+        """
+        # More requests than pooled connections would open and discard a
+        # transient connection per page (pool_block=False)
+        prefetch = min(prefetch, self._pool_maxsize)
+        executor = ThreadPoolExecutor(max_workers=prefetch, thread_name_prefix="wdmmg-prefetch")
+        pending: deque[Future[dict[str, Any]]] = deque()
+        page_request = self._page_request(params)
+        next_offset = 0
+
+        def submit_next() -> None:
+            nonlocal next_offset
+            page_params = {**params, "offset": next_offset}
+            pending.append(executor.submit(self._fetch_page, page_params, model, page_request))
+            next_offset += page_size
+
+        try:
+            for _ in range(prefetch):
+                submit_next()
+
+            while pending:
+                data = pending.popleft().result()
+                has_more = data.get("has_more", False)
+                if has_more:
+                    # Keep the window full while the caller consumes this page
+                    submit_next()
+                yield data
+                if not has_more:
+                    break
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
 
     @staticmethod
     def _normalize_date(value: str | date | None) -> str | None:
         """Normalize a date value to ISO format string.
 
+        Results are cached, so repeated queries over the same range skip
+        re-parsing. Invalid values raise every time.
+
         Args:
             value: A date object, ISO format string (YYYY-MM-DD), or None.
 
@@ -337,47 +905,123 @@ class WdmmgClient:
             ValueError: If the string is not in valid ISO format.
             TypeError: If the value is not a string, date, or None.
         """
-        if value is None:
+        # Check before the cache, which would fail on unhashable values
+        if value is not None and not isinstance(value, (str, date)):
+            raise TypeError(f"Expected str, date, or None, got {type(value).__name__}")
+        return _normalize_date_cached(value)
+
+    @staticmethod
+    def _parse_retry_after(value: str | None) -> int | None:
+        """Parse a Retry-After header into whole seconds.
+
+        Args:
+            value: The raw header value, either delay-seconds or an HTTP-date.
+
+        Returns:
+            Seconds to wait (rounded up), or None if missing or malformed.
+        """
+        if not value:
+            return None
+        try:
+            return math.ceil(_JitteredRetry(0).parse_retry_after(value))
+        except InvalidHeader:
             return None
-        if isinstance(value, date):
-            return value.isoformat()
-        if isinstance(value, str):
-            # Validate the string format by parsing it
-            try:
-                date.fromisoformat(value)
-            except ValueError as e:
-                raise ValueError(
-                    f"Invalid date format: '{value}'. Expected ISO format (YYYY-MM-DD)."
-                ) from e
-            return value
-        raise TypeError(
-            f"Expected str, date, or None, got {type(value).__name__}"
-        )
 
-    def _request(self, method: str, endpoint: str, **kwargs: Any) -> dict[str, Any]:
-        """Make an HTTP request to the API.
+    def _send(
+            self,
+            method: str,
+            url: str,
+            *,
+            accepted_statuses: frozenset[int] = frozenset(),
+            **kwargs: Any,
+    ) -> requests.Response:
+        """Send an HTTP request and check the response status.
 
         Args:
             method: HTTP method (GET, POST, PUT, DELETE, etc.)
-            endpoint: API endpoint path (without base URL)
+            url: Absolute request URL
+            accepted_statuses: Error statuses the caller handles itself;
+                these are returned instead of raised (and not logged).
             **kwargs: Additional arguments passed to requests.Session.request()
 
         Returns:
-            Parsed JSON response as a dictionary.
+            The successful response, with its body unread if stream=True.
 
         Raises:
             WdmmgAuthError: If authentication fails (401/403)
-            WdmmgRateLimitError: If rate limit is exceeded (429)
-            WdmmgAPIError: If the API returns any other error (4xx/5xx)
+            WdmmgRateLimitError: If rate limit is still exceeded (429) after
+                retries are exhausted
+            WdmmgAPIError: If the API returns any other error (4xx/5xx) or
+                redirects the request
             WdmmgError: If the request fails due to network issues
         """
-        url = f"{self._base_url}/{endpoint.lstrip('/')}"
+        if self._http2_client is not None:
+            return self._send_http2(
+                self._http2_client, method, url, accepted_statuses=accepted_statuses, **kwargs
+            )
+
         kwargs.setdefault("timeout", self._timeout)
+        # All endpoints live on one canonical host; a redirect means the
+        # base URL is misconfigured and is raised by _check_response()
+        kwargs.setdefault("allow_redirects", False)
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Request: %s %s params=%s", method, url, kwargs.get("params"))
+        return self._dispatch(
+            method, url, self._session.request, method, url, accepted_statuses=accepted_statuses, **kwargs
+        )
+
+    def _send_prepared(self, prepared: requests.PreparedRequest, **kwargs: Any) -> requests.Response:
+        """Send an already prepared request and check the response status.
+
+        Unlike _send(), this skips requests' per-call request preparation,
+        so callers must pass the environment settings themselves (see
+        _PageRequest).
 
-        logger.debug("Request: %s %s params=%s", method, url, kwargs.get("params"))
+        Args:
+            prepared: The request to send.
+            **kwargs: Additional arguments passed to requests.Session.send()
+
+        Returns:
+            The successful response, with its body unread if stream=True.
+
+        Raises:
+            See _send().
+        """
+        # Both are always set once a request is prepared
+        method = prepared.method or ""
+        url = prepared.url or ""
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Request: %s %s", method, url)
+        return self._dispatch(method, url, self._session.send, prepared, **kwargs)
+
+    def _dispatch(
+            self,
+            method: str,
+            url: str,
+            send: Callable[..., requests.Response],
+            *args: Any,
+            accepted_statuses: frozenset[int] = frozenset(),
+            **kwargs: Any,
+    ) -> requests.Response:
+        """Call a requests send function, translating errors.
 
+        Args:
+            method: HTTP method, for logging.
+            url: Request URL, for logging.
+            send: requests.Session.request or requests.Session.send.
+            *args: Positional arguments for `send`.
+            accepted_statuses: Error statuses returned instead of raised.
+            **kwargs: Keyword arguments for `send`.
+
+        Returns:
+            The successful response, with its body unread if stream=True.
+
+        Raises:
+            See _send().
+        """
         try:
-            response = self._session.request(method, url, **kwargs)
+            response = send(*args, **kwargs)
         except requests.exceptions.Timeout as e:
             logger.error("Request timed out: %s %s", method, url)
             raise WdmmgError(f"Request timed out: {e}") from e
@@ -388,22 +1032,492 @@ class WdmmgClient:
             logger.error("Request failed: %s %s - %s", method, url, e)
             raise WdmmgError(f"Request failed: {e}") from e
 
+        if logger.isEnabledFor(logging.DEBUG):
+            if kwargs.get("stream"):
+                logger.debug("Response: %d (streamed)", response.status_code)
+            else:
+                logger.debug("Response: %d (%d bytes)", response.status_code, len(response.content))
+
+        if response.status_code in accepted_statuses:
+            return response
+        try:
+            _check_response(response)
+        except WdmmgError:
+            # Release the connection of a streamed error response
+            response.close()
+            raise
+        return response
+
+    def _send_http2(
+            self,
+            client: "httpx.Client",
+            method: str,
+            url: str,
+            *,
+            accepted_statuses: frozenset[int] = frozenset(),
+            **kwargs: Any,
+    ) -> Any:
+        """Send an HTTP request over the httpx HTTP/2 client.
+
+        Retries the same status codes as the requests transport, with the
+        same jittered backoff.
+
+        Args:
+            client: The client's HTTP/2 httpx client.
+            method: HTTP method (GET, POST, PUT, DELETE, etc.)
+            url: Absolute request URL
+            accepted_statuses: Error statuses returned instead of raised.
+            **kwargs: Additional arguments passed to httpx.Client.request()
+
+        Returns:
+            The successful httpx response.
+
+        Raises:
+            See _send().
+        """
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Request: %s %s params=%s", method, url, kwargs.get("params"))
+
+        for attempt in range(self._max_retries + 1):
+            with _translate_httpx_errors(method, url):
+                response = client.request(method, url, **kwargs)
+            delay = _next_retry_delay(method, url, response, attempt, self._max_retries)
+            if delay is None:
+                break
+            time.sleep(delay)
+
+        if response.status_code not in accepted_statuses:
+            _check_response(response)
+        return response
+
+
+# =============================================================================
+# Helpers
+# =============================================================================
+
+
+def _resolve_config(
+        api_key: str | None,
+        base_url: str | None,
+        default_base_url: str,
+) -> tuple[str, str]:
+    """Resolve the API key and base URL from arguments or the environment.
+
+    Args:
+        api_key: The api_key argument, or None to read WDMMG_API_KEY.
+        base_url: The base_url argument, or None to read WDMMG_BASE_URL.
+        default_base_url: Base URL used when neither is set.
+
+    Returns:
+        The API key and the base URL without a trailing slash.
+
+    Raises:
+        ValueError: If no API key is provided and WDMMG_API_KEY is not set.
+    """
+    resolved_api_key = api_key or os.environ.get("WDMMG_API_KEY")
+    if not resolved_api_key:
+        raise ValueError(
+            "API key is required. Pass api_key argument or set WDMMG_API_KEY environment variable."
+        )
+
+    resolved_base_url = (
+            base_url
+            or os.environ.get("WDMMG_BASE_URL")
+            or default_base_url
+    )
+    return resolved_api_key, resolved_base_url.rstrip("/")
+
+
+class _BatchSubResponse:
+    """One entry of a batch response, shaped like an HTTP response.
+
+    Lets _check_response() map sub-request failures to the same
+    exceptions as standalone requests.
+    """
+
+    __slots__ = ("status_code", "headers", "content")
+
+    def __init__(self, sub: dict[str, Any]):
+        self.status_code: int = sub.get("status", 200)
+        self.headers: dict[str, str] = sub.get("headers") or {}
+        body = sub.get("body")
+        text = body if isinstance(body, str) else json.dumps(body)
+        self.content = text.encode("utf-8")
+
+
+class _PageRequest:
+    """A prepared transactions request, cloned for every page.
+
+    Session.request() merges headers, cookies, auth and environment
+    settings on every call. Pagination only changes the query string, so
+    this does that work once and each page just re-encodes the URL and
+    re-reads the session cookies, which responses may have updated.
+
+    Attributes:
+        send_kwargs: Keyword arguments for Session.send(): the timeout,
+            allow_redirects=False, and the proxy, TLS and stream settings
+            Session.request() would have resolved.
+    """
+
+    __slots__ = ("_session", "_template", "_url", "send_kwargs")
+
+    def __init__(
+            self,
+            session: requests.Session,
+            url: str,
+            params: dict[str, Any],
+            timeout: tuple[float, float] | float,
+    ):
+        self._session = session
+        self._url = url
+        self._template = session.prepare_request(requests.Request("GET", url, params=params))
+        # Proxy and TLS settings depend only on the host, not the query
+        self.send_kwargs: dict[str, Any] = session.merge_environment_settings(
+            url, {}, None, None, None
+        )
+        self.send_kwargs["timeout"] = timeout
+        self.send_kwargs["allow_redirects"] = False
+
+    def prepare(self, params: dict[str, Any]) -> requests.PreparedRequest:
+        """Clone the template with new query parameters and current cookies."""
+        prepared = self._template.copy()
+        prepared.prepare_url(self._url, params)
+        # Pick up cookies set by earlier pages, e.g. load balancer stickiness
+        prepared.headers.pop("Cookie", None)
+        prepared.prepare_cookies(self._session.cookies)
+        return prepared
+
+
+def _httpx_options(
+        api_key: str,
+        timeout: tuple[float, float] | float,
+        pool_maxsize: int,
+) -> tuple[dict[str, str], "httpx.Timeout", "httpx.Limits"]:
+    """Translate the client settings into httpx headers, timeout and limits.
+
+    Args:
+        api_key: The API key sent as a bearer token.
+        timeout: A single timeout or a (connect_timeout, read_timeout) tuple.
+        pool_maxsize: Maximum number of open connections.
+
+    Returns:
+        The default headers, timeout and connection limits.
+
+    Raises:
+        ImportError: If httpx is not installed.
+    """
+    if httpx is None:
+        raise ImportError("This feature requires httpx. Install it with: pip install 'wdmmg[async]'")
+
+    headers = {
+        "Authorization": f"Bearer {api_key}",
+        "Accept": "application/json",
+    }
+    if isinstance(timeout, tuple):
+        connect_timeout, read_timeout = timeout
+        httpx_timeout = httpx.Timeout(read_timeout, connect=connect_timeout)
+    else:
+        httpx_timeout = httpx.Timeout(timeout)
+
+    limits = httpx.Limits(
+        max_connections=pool_maxsize,
+        max_keepalive_connections=pool_maxsize,
+    )
+    return headers, httpx_timeout, limits
+
+
+def _make_httpx_client(
+        api_key: str,
+        timeout: tuple[float, float] | float,
+        pool_maxsize: int,
+        max_retries: int,
+        *,
+        http2: bool,
+) -> "httpx.Client":
+    """Build an httpx client configured like the requests session.
+
+    Args:
+        api_key: The API key sent as a bearer token.
+        timeout: A single timeout or a (connect_timeout, read_timeout) tuple.
+        pool_maxsize: Maximum number of open connections.
+        max_retries: Number of times to retry failed connection attempts.
+        http2: Whether to negotiate HTTP/2 (requires h2).
+
+    Returns:
+        A new httpx.Client.
+
+    Raises:
+        ImportError: If httpx is not installed, or http2 is True and h2
+            is not installed.
+    """
+    headers, httpx_timeout, limits = _httpx_options(api_key, timeout, pool_maxsize)
+    # The transport retries connection failures; status codes are retried
+    # by the caller
+    transport = httpx.HTTPTransport(http2=http2, limits=limits, retries=max_retries)
+    return httpx.Client(headers=headers, timeout=httpx_timeout, transport=transport)
+
+
+def _make_async_httpx_client(
+        api_key: str,
+        timeout: tuple[float, float] | float,
+        pool_maxsize: int,
+        max_retries: int,
+        *,
+        http2: bool,
+) -> "httpx.AsyncClient":
+    """Build an httpx.AsyncClient configured like the requests session.
+
+    See _make_httpx_client().
+    """
+    headers, httpx_timeout, limits = _httpx_options(api_key, timeout, pool_maxsize)
+    transport = httpx.AsyncHTTPTransport(http2=http2, limits=limits, retries=max_retries)
+    return httpx.AsyncClient(headers=headers, timeout=httpx_timeout, transport=transport)
+
+
+def _transaction_page_model() -> type:
+    """Return the msgspec model for transaction pages.
+
+    Raises:
+        ImportError: If msgspec is not installed.
+    """
+    if msgspec is None:
+        raise ImportError("typed=True requires msgspec. Install it with: pip install 'wdmmg[typed]'")
+    from .models import TransactionPage
+
+    return TransactionPage
+
+
+def _backoff_delay(retry_number: int, backoff_factor: float = _BACKOFF_FACTOR) -> float:
+    """Compute the jittered exponential backoff before a retry.
+
+    Used by both _JitteredRetry and the httpx transports, so every client
+    waits 0, 1, 2, ... seconds (with the default factor) plus jitter.
+
+    Args:
+        retry_number: Number of consecutive failed attempts so far (1 for
+            the first retry).
+        backoff_factor: Base delay multiplier.
+
+    Returns:
+        Delay in seconds, capped at _JitteredRetry.BACKOFF_MAX.
+    """
+    backoff = 0.0 if retry_number <= 1 else backoff_factor * (2 ** (retry_number - 1))
+    return min(_JitteredRetry.BACKOFF_MAX, backoff + random.uniform(0, _JitteredRetry.BACKOFF_JITTER))
+
+
+def _retry_delay(attempt: int, response: Any) -> float:
+    """Compute how long to wait before retrying a request.
+
+    Honors Retry-After when present (capped and jittered as in
+    _JitteredRetry); otherwise uses _backoff_delay().
+
+    Args:
+        attempt: Zero-based number of the attempt that just failed.
+        response: The response that triggered the retry.
+
+    Returns:
+        Delay in seconds.
+    """
+    retry_after = WdmmgClient._parse_retry_after(response.headers.get("Retry-After"))
+    if retry_after is not None:
+        return min(retry_after, _JitteredRetry.BACKOFF_MAX) + random.uniform(0, 1)
+    return _backoff_delay(attempt + 1)
+
+
+def _next_retry_delay(
+        method: str,
+        url: str,
+        response: Any,
+        attempt: int,
+        max_retries: int,
+) -> float | None:
+    """Decide whether an httpx response should be retried.
+
+    Args:
+        method: HTTP method, for logging.
+        url: Request URL, for logging.
+        response: The response just received.
+        attempt: Zero-based number of the attempt that produced it.
+        max_retries: Maximum number of retries allowed.
+
+    Returns:
+        Seconds to wait before retrying, or None to stop and check the
+        response.
+    """
+    debug = logger.isEnabledFor(logging.DEBUG)
+    if debug:
         logger.debug("Response: %d (%d bytes)", response.status_code, len(response.content))
 
-        # Handle error responses
-        if response.status_code == 401:
-            logger.warning("Authentication failed: invalid API key")
-            raise WdmmgAuthError("Invalid API key")
-        if response.status_code == 403:
-            logger.warning("Authentication failed: access forbidden")
-            raise WdmmgAuthError("Access forbidden")
-        if response.status_code == 429:
-            retry_after_header = response.headers.get("Retry-After")
-            retry_after = int(retry_after_header) if retry_after_header else None
-            logger.warning("Rate limit exceeded. Retry-After: %s", retry_after)
-            raise WdmmgRateLimitError(retry_after)
-        if response.status_code >= 400:
-            logger.error("API error %d: %s", response.status_code, response.text[:500])
-            raise WdmmgAPIError(response.status_code, response.text)
+    if response.status_code not in _RETRY_STATUS_CODES or attempt >= max_retries:
+        return None
+    delay = _retry_delay(attempt, response)
+    if debug:
+        logger.debug("Retrying %s %s in %.2fs (status %d)", method, url, delay, response.status_code)
+    return delay
+
+
+@contextmanager
+def _translate_httpx_errors(method: str, url: str) -> Iterator[None]:
+    """Translate httpx transport errors into WdmmgError.
+
+    Args:
+        method: HTTP method, for logging.
+        url: Request URL, for logging.
+
+    Raises:
+        WdmmgError: If the wrapped httpx call fails.
+    """
+    try:
+        yield
+    except httpx.TimeoutException as e:
+        logger.error("Request timed out: %s %s", method, url)
+        raise WdmmgError(f"Request timed out: {e}") from e
+    except httpx.NetworkError as e:
+        logger.error("Connection error: %s %s - %s", method, url, e)
+        raise WdmmgError(f"Connection failed: {e}") from e
+    except httpx.HTTPError as e:
+        logger.error("Request failed: %s %s - %s", method, url, e)
+        raise WdmmgError(f"Request failed: {e}") from e
+
+
+def _check_response(response: Any) -> None:
+    """Raise the matching client exception for an error response.
+
+    Works with both requests and httpx responses.
+
+    Args:
+        response: The HTTP response to check.
+
+    Raises:
+        WdmmgAuthError: If authentication fails (401/403)
+        WdmmgRateLimitError: If rate limit is exceeded (429)
+        WdmmgAPIError: If the API returns any other error (4xx/5xx), or an
+            unexpected redirect (3xx other than 304)
+    """
+    if 300 <= response.status_code < 400 and response.status_code != 304:
+        location = response.headers.get("Location")
+        logger.error("Unexpected redirect %d to %s; check base_url", response.status_code, location)
+        raise WdmmgAPIError(response.status_code, f"Unexpected redirect to {location}")
+    if response.status_code == 401:
+        logger.warning("Authentication failed: invalid API key")
+        raise WdmmgAuthError("Invalid API key")
+    if response.status_code == 403:
+        logger.warning("Authentication failed: access forbidden")
+        raise WdmmgAuthError("Access forbidden")
+    if response.status_code == 429:
+        # Retries have already waited out Retry-After up to max_retries
+        # times; surface the final 429 to the caller.
+        retry_after = WdmmgClient._parse_retry_after(response.headers.get("Retry-After"))
+        logger.warning("Rate limit exceeded. Retry-After: %s", retry_after)
+        raise WdmmgRateLimitError(retry_after)
+    if response.status_code >= 400:
+        body = _error_body(response)
+        logger.error("API error %d: %s", response.status_code, body[:500])
+        raise WdmmgAPIError(response.status_code, body)
+
+
+def _error_body(response: Any) -> str:
+    """Read a bounded prefix of an error response body as text.
+
+    Avoids response.text, which decodes the whole body (and, for streamed
+    responses, downloads it first).
+
+    Args:
+        response: A requests or httpx response.
+
+    Returns:
+        Up to _ERROR_BODY_LIMIT bytes of the body, decoded as UTF-8.
+    """
+    if hasattr(response, "iter_content"):
+        # requests: stop reading once the limit is reached, even when
+        # streaming; chunks can be shorter than the requested size
+        chunks = []
+        size = 0
+        for chunk in response.iter_content(_ERROR_BODY_LIMIT):
+            chunks.append(chunk)
+            size += len(chunk)
+            if size >= _ERROR_BODY_LIMIT:
+                break
+        content = b"".join(chunks)
+    else:
+        content = response.content
+    return content[:_ERROR_BODY_LIMIT].decode("utf-8", errors="replace")
+
+
+def _decode_json(response: Any, model: type | None = None) -> Any:
+    """Decode a JSON response body, using orjson when it is installed.
+
+    Args:
+        response: A requests or httpx response with a fully read body.
+        model: Optional msgspec type to decode and validate the body into.
+
+    Returns:
+        The parsed JSON value, or an instance of `model`.
 
+    Raises:
+        WdmmgError: If the body is not valid JSON or does not match `model`.
+    """
+    if model is not None:
+        try:
+            return msgspec.json.decode(response.content, type=model)
+        except msgspec.DecodeError as e:
+            # Also covers ValidationError, its subclass
+            logger.error("Invalid response: %s", e)
+            raise WdmmgError(f"Invalid response: {e}") from e
+    try:
+        if orjson is not None:
+            return orjson.loads(response.content)
         return response.json()
+    except ValueError as e:
+        # Same error as the streaming (ijson) path raises
+        logger.error("Invalid response: %s", e)
+        raise WdmmgError(f"Invalid response: {e}") from e
+
+
+def _iter_streamed_page(fp: IO[bytes]) -> Generator[Any, None, tuple[int, bool]]:
+    """Incrementally parse a transactions page, yielding each transaction.
+
+    Args:
+        fp: Readable binary stream holding a page response body.
+
+    Yields:
+        Items of the page's "transactions" array as soon as each is complete.
+
+    Returns:
+        A (count, has_more) tuple for the page.
+
+    Raises:
+        KeyError: If the page has no "transactions" key.
+    """
+    count = 0
+    has_more = False
+    seen_transactions = False
+    builder = None
+
+    # Not use_float=True: the C backend then rejects integers wider than
+    # 64 bits, which json.loads() accepts. Non-integers arrive as Decimal
+    # and are converted to match json.loads().
+    for prefix, event, value in ijson.parse(fp):
+        if event == "number" and type(value) is Decimal:
+            value = float(value)
+        if builder is not None:
+            builder.event(event, value)
+            if prefix == "transactions.item" and event in ("end_map", "end_array"):
+                yield builder.value
+                count += 1
+                builder = None
+        elif prefix == "transactions.item":
+            if event in ("start_map", "start_array"):
+                builder = ObjectBuilder()
+                builder.event(event, value)
+            else:
+                yield value
+                count += 1
+        elif prefix == "transactions" and event == "start_array":
+            seen_transactions = True
+        elif prefix == "has_more":
+            has_more = bool(value)
+
+    if not seen_transactions:
+        raise KeyError("transactions")
+    return count, has_more
@@ -0,0 +1,50 @@
+"""Typed WDMMG API response models.
+
+These msgspec structs let the client decode and validate responses in a
+single pass and give callers attribute access instead of dict lookups.
+
+Requires the ``typed`` extra (``pip install "wdmmg[typed]"``).
+
+Example:
+    >>> for txn in client.iter_transactions(typed=True):
+    ...     if txn.amount > 1000:
+    ...         print(f"Large transaction: {txn.description}")
+"""
+
+import datetime
+from decimal import Decimal
+
+import msgspec
+
+
+class Transaction(msgspec.Struct):
+    """A single transaction.
+
+    Fields not listed here are ignored when decoding.
+
+    Attributes:
+        id: Unique transaction identifier.
+        amount: Transaction amount, decoded exactly as a Decimal.
+        date: Date the transaction was made, if provided.
+        description: Free-text description, if provided.
+        account_id: Identifier of the account the transaction belongs to,
+            if provided.
+    """
+
+    id: str | int
+    amount: Decimal
+    date: datetime.date | None = None
+    description: str | None = None
+    account_id: str | int | None = None
+
+
+class TransactionPage(msgspec.Struct):
+    """One page of a transactions listing.
+
+    Attributes:
+        transactions: Transactions on this page.
+        has_more: Whether more pages follow.
+    """
+
+    transactions: list[Transaction]
+    has_more: bool = False